@@ -1,68 +1,473 @@
 # Expense Manager Application
 
 import os
+import re
 import json
 import csv
-from datetime import datetime, timedelta
-import pandas as pd
-import matplotlib.pyplot as plt
+import atexit
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog, filedialog
+from tkinter import ttk, messagebox, simpledialog
+
+# orjson is optional; fall back to the standard json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_YMD_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII)
+
+@lru_cache(maxsize=8192)
+def _parse_ymd(date_str):
+    """
+    Parse a YYYY-MM-DD string into a date, caching results per unique string
+    """
+    # Zero-padded dates skip strptime; anything else falls back to it
+    match = _YMD_PATTERN.fullmatch(date_str)
+    if match:
+        year, month, day = match.groups()
+        return date(int(year), int(month), int(day))
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+@dataclass(slots=True)
+class Expense:
+    """
+    A single expense record
+    """
+    id: int
+    amount: float
+    category: str
+    date: str
+    description: str = ''
+    
+    # Day ordinal of the date, cached so it is never reparsed
+    ordinal: int = field(init=False, repr=False, compare=False)
+    
+    # Fields that edit_expense is allowed to change
+    EDITABLE_FIELDS = ('amount', 'category', 'date', 'description')
+
+    def __post_init__(self):
+        self.ordinal = _parse_ymd(self.date).toordinal()
+
+    @property
+    def year(self):
+        """
+        Year of the expense date, used to pick its storage shard
+        """
+        return date.fromordinal(self.ordinal).year
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create an expense from a record read from disk
+        """
+        return cls(data['id'], float(data['amount']), data['category'], data['date'], data.get('description', ''))
+
+    def to_dict(self):
+        """
+        Convert the expense to a record for writing to disk
+        """
+        return {
+            'id': self.id,
+            'amount': self.amount,
+            'category': self.category,
+            'date': self.date,
+            'description': self.description
+        }
 
 class ExpenseManager:
+    # Categories beyond this many are grouped as 'Other' in charts
+    MAX_CHART_CATEGORIES = 10
+
     def __init__(self, data_file='expenses.json'):
         """
         Initialize the Expense Manager with data persistence
         """
         self.data_file = data_file
-        self.expenses = []
+        
+        # Expenses are stored in one file per year next to a manifest, e.g.
+        # expenses.d/2025.json and expenses.d/manifest.json for expenses.json
+        self._shard_dir = os.path.splitext(data_file)[0] + '.d'
+        self._manifest_file = os.path.join(self._shard_dir, 'manifest.json')
+        self._year_summaries = {}
+        self._unloaded_years = set()
+        self._unreadable_years = set()
+        self._dirty_years = set()
+        
+        # Records of each year file that could not be read, written back unchanged
+        self._invalid_records = {}
+        
+        # Set when the manifest could not be read; saving would orphan every year file
+        self._save_blocked = False
+        
+        # Expenses keyed by ID, in insertion order
+        self.expenses_by_id = {}
+        self._next_id = 1
+        
+        # Running totals kept up to date on every add, edit and delete
+        self._total = 0.0
+        self._cat_totals = {}
+        self._cat_counts = {}
+        self._daily_totals = {}
+        self._day_counts = {}
+        self._sorted_days = []
         self.income = 0
         self.spending_limits = {
             'daily': 0,
             'monthly': 0,
             'yearly': 0
         }
+        self._dirty = False
+        self._batch_depth = 0
+        
+        # Chart figure and axes, created on first use and reused afterwards
+        self._fig = None
+        self._ax_bar = None
+        self._ax_pie = None
         self.load_data()
+        
+        # Retry any failed save before the program exits; close() removes this
+        # so a manager that is no longer in use cannot overwrite newer data
+        atexit.register(self.flush)
 
     def load_data(self):
         """
-        Load existing expense data from JSON file
+        Load existing expense data, reading only recent years eagerly
+        """
+        # Migrating a single-file save or renumbering duplicate IDs while the
+        # years load is written out once, after the whole load
+        with self.batch():
+            self._read_data()
+
+    def _read_data(self):
         """
+        Read the manifest or single-file save and the recent years it lists
+        """
+        self._year_summaries = {}
+        self._unloaded_years = set()
+        self._unreadable_years = set()
+        self._dirty_years = set()
+        self._invalid_records = {}
+        self._dirty = False
+        self._save_blocked = False
+        self._next_id = 1
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    self.expenses = data.get('expenses', [])
-                    self.income = data.get('income', 0)
-                    self.spending_limits = data.get('spending_limits', {
-                        'daily': 0,
-                        'monthly': 0,
-                        'yearly': 0
-                    })
+            self.expenses_by_id = {}
+            if os.path.exists(self._manifest_file):
+                data = self._read_json(self._manifest_file)
+                self._next_id = data.get('next_id', 1)
+                self._year_summaries = {
+                    int(year): summary for year, summary in data.get('years', {}).items()
+                }
+                self._unloaded_years = set(self._year_summaries)
+            elif os.path.exists(self.data_file):
+                # Single-file format; split it into year files
+                data = self._read_json(self.data_file)
+                self._load_expenses(data)
+                self._dirty_years = {exp.year for exp in self.expenses_by_id.values()}
+                self.save_data()
+            else:
+                data = {}
+            self.income = data.get('income', 0)
+            self.spending_limits = data.get('spending_limits', {
+                'daily': 0,
+                'monthly': 0,
+                'yearly': 0
+            })
         except (json.JSONDecodeError, IOError):
             # Initialize with empty data if file is corrupted or can't be read
-            self.expenses = []
+            self.expenses_by_id = {}
+            self._year_summaries = {}
+            self._unloaded_years = set()
+            self._dirty_years = set()
+            self._next_id = 1
             self.income = 0
             self.spending_limits = {
                 'daily': 0,
                 'monthly': 0,
                 'yearly': 0
             }
+            if os.path.exists(self._manifest_file):
+                self._save_blocked = True
+                print("Error: Could not read the expense manifest. Changes will not be saved.")
+        self._rebuild_indexes()
+        
+        # Read recent years now; older ones stay on disk until a query reaches them
+        first_eager_year = datetime.now().year - 1
+        for year in sorted(self._unloaded_years):
+            if year >= first_eager_year:
+                self._ensure_year_loaded(year)
+
+    @staticmethod
+    def _read_json(path):
+        """
+        Read a JSON file, using orjson when it is available
+        """
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_json(path, data):
+        """
+        Write a JSON file through a temporary file so a crash never leaves it truncated
+        """
+        tmp_file = path + '.tmp'
+        if orjson is not None:
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(data))
+        else:
+            with open(tmp_file, 'w') as f:
+                f.write(json.dumps(data, separators=(',', ':')))
+        os.replace(tmp_file, path)
+
+    def _shard_path(self, year):
+        """
+        Path of the file holding one year of expenses
+        """
+        return os.path.join(self._shard_dir, f'{year}.json')
+
+    def _load_expenses(self, data, year=None):
+        """
+        Add the expense records of a loaded file to the in-memory expenses,
+        where year is the year file they came from
+        """
+        expenses = []
+        for record in data.get('expenses', []):
+            try:
+                expenses.append(Expense.from_dict(record))
+            except (ValueError, KeyError, TypeError):
+                # Older versions saved dates unchecked; skip the record rather than the whole load
+                if year is None:
+                    print(f"Error: Skipping unreadable expense {record}; it is left in {self.data_file}.")
+                else:
+                    print(f"Error: Skipping unreadable expense {record}.")
+                    self._invalid_records.setdefault(year, []).append(record)
+        
+        # Replacement IDs must also clear every ID still to come in this file
+        self._next_id = max(self._next_id, max((exp.id for exp in expenses), default=0) + 1)
+        renumbered = False
+        for expense in expenses:
+            if expense.id in self.expenses_by_id:
+                # Older files could reuse an ID after a delete; keep both records
+                expense.id = self._next_id
+                self._next_id += 1
+                self._dirty_years.add(expense.year)
+                renumbered = True
+            self.expenses_by_id[expense.id] = expense
+        if renumbered:
+            self.save_data()
+        return expenses
+
+    def _ensure_year_loaded(self, year):
+        """
+        Load the expenses of a year that was left on disk, returning False
+        if its file could not be read
+        """
+        if year not in self._unloaded_years:
+            return year not in self._unreadable_years
+        self._unloaded_years.discard(year)
+        try:
+            data = self._read_json(self._shard_path(year))
+        except (json.JSONDecodeError, IOError):
+            # Keep counting the year through its summary and never rewrite its file
+            self._unreadable_years.add(year)
+            print(f"Error: Could not read expenses for {year}.")
+            return False
+        
+        # Swap the year's summary for its actual expenses in the running totals
+        self._apply_summary(self._year_summaries[year], -1)
+        for expense in self._load_expenses(data, year):
+            self._update_totals(expense)
+        return True
+
+    def _require_year(self, year):
+        """
+        Make sure a year's expenses are in memory before changing that year
+        """
+        if not self._ensure_year_loaded(year):
+            raise ValueError(f"Expenses for {year} could not be read, so that year cannot be changed")
+
+    def _ensure_all_loaded(self):
+        """
+        Load every year that was left on disk at startup
+        """
+        for year in sorted(self._unloaded_years):
+            self._ensure_year_loaded(year)
+
+    def _rebuild_indexes(self):
+        """
+        Rebuild the next free ID and running totals from the loaded expenses
+        and the summaries of years still on disk
+        """
+        self._next_id = max(self._next_id, max(self.expenses_by_id, default=0) + 1)
+        
+        self._total = 0.0
+        self._cat_totals = {}
+        self._cat_counts = {}
+        self._daily_totals = {}
+        self._day_counts = {}
+        self._sorted_days = []
+        
+        # Bind the per-row helper once instead of looking it up per expense
+        update_totals = self._update_totals
+        for expense in self.expenses_by_id.values():
+            update_totals(expense)
+        for year in self._unloaded_years | self._unreadable_years:
+            self._apply_summary(self._year_summaries[year])
+
+    @staticmethod
+    def _summarize(expenses):
+        """
+        Total and per-category amounts and counts for one year of expenses
+        """
+        total = 0.0
+        categories = {}
+        for expense in expenses:
+            total += expense.amount
+            entry = categories.setdefault(expense.category, [0.0, 0])
+            entry[0] += expense.amount
+            entry[1] += 1
+        return {'total': total, 'categories': categories}
+
+    def _apply_summary(self, summary, sign=1):
+        """
+        Add a year summary to the running totals, or remove it with sign=-1
+        """
+        self._total += sign * summary['total']
+        for category, (amount, count) in summary['categories'].items():
+            self._update_category(category, sign * amount, sign * count)
+
+    def _update_category(self, category, amount, count):
+        """
+        Adjust the running total and expense count of a category
+        """
+        # Drop categories once their last expense is gone
+        count += self._cat_counts.get(category, 0)
+        if count:
+            self._cat_counts[category] = count
+            self._cat_totals[category] = self._cat_totals.get(category, 0) + amount
+        else:
+            del self._cat_counts[category]
+            del self._cat_totals[category]
+
+    def _update_totals(self, expense, sign=1):
+        """
+        Add an expense to the running totals, or remove it with sign=-1
+        """
+        amount = sign * expense.amount
+        
+        self._total += amount
+        self._update_category(expense.category, amount, sign)
+        
+        # Days with expenses are kept sorted so date ranges can be bisected
+        day = expense.ordinal
+        count = self._day_counts.get(day, 0) + sign
+        if count:
+            if day not in self._day_counts:
+                insort(self._sorted_days, day)
+            self._day_counts[day] = count
+            self._daily_totals[day] = self._daily_totals.get(day, 0) + amount
+        else:
+            del self._day_counts[day]
+            del self._daily_totals[day]
+            del self._sorted_days[bisect_left(self._sorted_days, day)]
+
+    def _sum_between(self, first_ord, last_ord):
+        """
+        Sum expenses dated between two day ordinals, inclusive
+        """
+        if self._unloaded_years:
+            first_year = date.fromordinal(first_ord).year
+            last_year = date.fromordinal(last_ord).year
+            for year in sorted(self._unloaded_years):
+                if first_year <= year <= last_year:
+                    self._ensure_year_loaded(year)
+        
+        lo = bisect_left(self._sorted_days, first_ord)
+        hi = bisect_right(self._sorted_days, last_ord)
+        daily_totals = self._daily_totals
+        return sum((daily_totals[day] for day in self._sorted_days[lo:hi]), 0.0)
 
     def save_data(self):
         """
-        Save expense data to JSON file
+        Mark data as changed and write it out unless a batch is in progress
+        """
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self):
         """
+        Write pending changes to the year files and the manifest
+        """
+        if not self._dirty:
+            return
+        if self._save_blocked:
+            print("Error: Not saving, because the expense manifest could not be read.")
+            return
+        
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump({
-                    'expenses': self.expenses,
-                    'income': self.income,
-                    'spending_limits': self.spending_limits
-                }, f, indent=4)
+            os.makedirs(self._shard_dir, exist_ok=True)
+            
+            # Rewrite only the years that changed
+            if self._dirty_years:
+                by_year = {year: [] for year in self._dirty_years}
+                for expense in self.expenses_by_id.values():
+                    year_expenses = by_year.get(expense.year)
+                    if year_expenses is not None:
+                        year_expenses.append(expense)
+                for year, expenses in by_year.items():
+                    shard_path = self._shard_path(year)
+                    invalid = self._invalid_records.get(year, [])
+                    if expenses or invalid:
+                        records = [exp.to_dict() for exp in expenses]
+                        records.extend(invalid)
+                        self._write_json(shard_path, {'expenses': records})
+                        self._year_summaries[year] = self._summarize(expenses)
+                    else:
+                        if os.path.exists(shard_path):
+                            os.remove(shard_path)
+                        self._year_summaries.pop(year, None)
+                self._dirty_years.clear()
+            
+            self._write_json(self._manifest_file, {
+                'next_id': self._next_id,
+                'years': {str(year): summary for year, summary in sorted(self._year_summaries.items())},
+                'income': self.income,
+                'spending_limits': self.spending_limits
+            })
+            self._dirty = False
         except IOError:
             print("Error: Could not save data to file.")
 
+    @contextmanager
+    def batch(self):
+        """
+        Defer saving until the end of a group of changes, e.g. a bulk import
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def close(self):
+        """
+        Write any pending changes and stop flushing this manager at exit
+        """
+        self.flush()
+        atexit.unregister(self.flush)
+
     def add_expense(self, amount, category, date=None, description=''):
         """
         Add a new expense to the list
@@ -73,15 +478,14 @@ class ExpenseManager:
         # Use current date if no date provided
         expense_date = date or datetime.now().strftime('%Y-%m-%d')
         
-        expense = {
-            'id': len(self.expenses) + 1,
-            'amount': float(amount),
-            'category': category,
-            'date': expense_date,
-            'description': description
-        }
+        # The year file is rewritten on save, so its existing expenses must be loaded
+        self._require_year(_parse_ymd(expense_date).year)
         
-        self.expenses.append(expense)
+        expense = Expense(self._next_id, float(amount), category, expense_date, description)
+        self.expenses_by_id[expense.id] = expense
+        self._next_id += 1
+        self._update_totals(expense)
+        self._dirty_years.add(expense.year)
         self.save_data()
         return expense
 
@@ -89,22 +493,77 @@ class ExpenseManager:
         """
         Edit an existing expense
         """
-        for expense in self.expenses:
-            if expense['id'] == expense_id:
-                # Update only provided fields
-                for key, value in kwargs.items():
-                    if key in expense:
-                        expense[key] = value
-                self.save_data()
-                return expense
-        raise ValueError(f"No expense found with ID {expense_id}")
+        expense = self.get_expense(expense_id)
+        if expense is None:
+            raise ValueError(f"No expense found with ID {expense_id}")
+        
+        # Keep only fields whose value actually changes
+        changes = {
+            key: value for key, value in kwargs.items()
+            if key in Expense.EDITABLE_FIELDS and getattr(expense, key) != value
+        }
+        if not changes:
+            return expense
+        
+        # Validate a new date before touching the running totals
+        if 'date' in changes:
+            new_date = _parse_ymd(changes['date'])
+            new_ordinal = new_date.toordinal()
+            self._require_year(new_date.year)
+        
+        # Update only changed fields
+        self._dirty_years.add(expense.year)
+        self._update_totals(expense, -1)
+        for key, value in changes.items():
+            setattr(expense, key, value)
+        if 'date' in changes:
+            expense.ordinal = new_ordinal
+        self._update_totals(expense)
+        self._dirty_years.add(expense.year)
+        self.save_data()
+        return expense
 
     def delete_expense(self, expense_id):
         """
         Delete an expense by its ID
         """
-        self.expenses = [exp for exp in self.expenses if exp['id'] != expense_id]
-        self.save_data()
+        expense = self.get_expense(expense_id)
+        if expense is not None:
+            del self.expenses_by_id[expense_id]
+            self._update_totals(expense, -1)
+            self._dirty_years.add(expense.year)
+            self.save_data()
+
+    def get_expense(self, expense_id):
+        """
+        Look up an expense by its ID, returning None if it does not exist
+        """
+        expense = self.expenses_by_id.get(expense_id)
+        if expense is None and self._unloaded_years:
+            # The expense may belong to a year still on disk
+            self._ensure_all_loaded()
+            expense = self.expenses_by_id.get(expense_id)
+        return expense
+
+    def get_all_expenses(self):
+        """
+        Return every expense in ID order, reading any years still on disk first
+        """
+        self._ensure_all_loaded()
+        return self.get_loaded_expenses()
+
+    def get_loaded_expenses(self):
+        """
+        Return the expenses already in memory in ID order, leaving years on disk unread
+        """
+        # Years read later are appended to the dict, so its order is not ID order
+        return sorted(self.expenses_by_id.values(), key=attrgetter('id'))
+
+    def has_unloaded_years(self):
+        """
+        Check whether some years of expenses have not been read yet
+        """
+        return bool(self._unloaded_years)
 
     def set_income(self, amount):
         """
@@ -112,6 +571,8 @@ class ExpenseManager:
         """
         if amount < 0:
             raise ValueError("Income cannot be negative")
+        if self.income == amount:
+            return
         self.income = float(amount)
         self.save_data()
 
@@ -125,6 +586,8 @@ class ExpenseManager:
         if amount < 0:
             raise ValueError("Spending limit cannot be negative")
         
+        if self.spending_limits.get(limit_type) == amount:
+            return
         self.spending_limits[limit_type] = float(amount)
         self.save_data()
 
@@ -132,51 +595,37 @@ class ExpenseManager:
         """
         Group expenses by category
         """
-        category_totals = {}
-        for expense in self.expenses:
-            category = expense['category']
-            amount = expense['amount']
-            category_totals[category] = category_totals.get(category, 0) + amount
-        return category_totals
+        return dict(self._cat_totals)
 
     def generate_expense_report(self):
         """
         Generate a comprehensive expense report
         """
-        # Convert expenses to DataFrame for easy analysis
-        df = pd.DataFrame(self.expenses)
+        # Derive every date bound from a single clock read
+        today = datetime.now().date()
+        today_ord = today.toordinal()
+        cur_year, cur_month = today.year, today.month
+        total_expenses = self._total
         
-        # Total expenses
-        total_expenses = df['amount'].sum()
-        
-        # Expenses by category
-        category_totals = self.get_expenses_by_category()
-        
-        # Check against spending limits
-        current_date = datetime.now()
-        daily_expenses = sum(
-            exp['amount'] for exp in self.expenses 
-            if datetime.strptime(exp['date'], '%Y-%m-%d').date() == current_date.date()
-        )
-        monthly_expenses = sum(
-            exp['amount'] for exp in self.expenses 
-            if datetime.strptime(exp['date'], '%Y-%m-%d').month == current_date.month
-        )
-        yearly_expenses = sum(
-            exp['amount'] for exp in self.expenses 
-            if datetime.strptime(exp['date'], '%Y-%m-%d').year == current_date.year
-        )
+        # Day ordinal bounds of the current month and year
+        month_start = today.replace(day=1).toordinal()
+        if cur_month == 12:
+            month_end = today.replace(year=cur_year + 1, month=1, day=1).toordinal() - 1
+        else:
+            month_end = today.replace(month=cur_month + 1, day=1).toordinal() - 1
+        year_start = today.replace(month=1, day=1).toordinal()
+        year_end = today.replace(month=12, day=31).toordinal()
         
         report = {
             'total_expenses': total_expenses,
-            'category_breakdown': category_totals,
+            'category_breakdown': self.get_expenses_by_category(),
             'income': self.income,
             'remaining_budget': self.income - total_expenses,
             'spending_limits': self.spending_limits,
             'current_expenses': {
-                'daily': daily_expenses,
-                'monthly': monthly_expenses,
-                'yearly': yearly_expenses
+                'daily': self._daily_totals.get(today_ord, 0.0),
+                'monthly': self._sum_between(month_start, month_end),
+                'yearly': self._sum_between(year_start, year_end)
             }
         }
         return report
@@ -185,24 +634,40 @@ class ExpenseManager:
         """
         Create visualizations for expenses
         """
-        # Prepare data
-        category_totals = self.get_expenses_by_category()
+        # Imported here so sessions that never plot skip matplotlib's startup cost
+        import matplotlib.pyplot as plt
+        
+        # Largest categories first, with the long tail folded into 'Other'
+        ranked = sorted(self._cat_totals.items(), key=lambda item: item[1], reverse=True)
+        if len(ranked) > self.MAX_CHART_CATEGORIES:
+            tail = ranked[self.MAX_CHART_CATEGORIES - 1:]
+            
+            # A user category named 'Other' absorbs the tail so it is charted once
+            grouped = dict(ranked[:self.MAX_CHART_CATEGORIES - 1])
+            grouped['Other'] = grouped.get('Other', 0) + sum(amount for _, amount in tail)
+            ranked = list(grouped.items())
+        categories = [category for category, _ in ranked]
+        amounts = [amount for _, amount in ranked]
+        
+        # Reuse the previous figure unless its window has been closed
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig, (self._ax_bar, self._ax_pie) = plt.subplots(1, 2, figsize=(10, 5))
+        else:
+            self._ax_bar.clear()
+            self._ax_pie.clear()
         
         # Bar Graph
-        plt.figure(figsize=(10, 5))
-        plt.subplot(1, 2, 1)
-        plt.bar(category_totals.keys(), category_totals.values())
-        plt.title('Expenses by Category')
-        plt.xlabel('Category')
-        plt.ylabel('Total Amount')
-        plt.xticks(rotation=45)
+        self._ax_bar.bar(categories, amounts)
+        self._ax_bar.set_title('Expenses by Category')
+        self._ax_bar.set_xlabel('Category')
+        self._ax_bar.set_ylabel('Total Amount')
+        self._ax_bar.tick_params(axis='x', labelrotation=45)
         
         # Pie Chart
-        plt.subplot(1, 2, 2)
-        plt.pie(category_totals.values(), labels=category_totals.keys(), autopct='%1.1f%%')
-        plt.title('Expense Distribution')
+        self._ax_pie.pie(amounts, labels=categories, autopct='%1.1f%%')
+        self._ax_pie.set_title('Expense Distribution')
         
-        plt.tight_layout()
+        self._fig.tight_layout()
         plt.show()
 
     def export_to_csv(self, filename=None):
@@ -213,19 +678,17 @@ class ExpenseManager:
             filename = f'expenses_{datetime.now().strftime("%Y%m%d")}.csv'
         
         try:
-            with open(filename, 'w', newline='') as csvfile:
-                fieldnames = ['ID', 'Amount', 'Category', 'Date', 'Description']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            expenses = self.get_all_expenses()
+            
+            # A large buffer coalesces the rows into few write calls
+            with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
                 
-                writer.writeheader()
-                for expense in self.expenses:
-                    writer.writerow({
-                        'ID': expense['id'],
-                        'Amount': expense['amount'],
-                        'Category': expense['category'],
-                        'Date': expense['date'],
-                        'Description': expense.get('description', '')
-                    })
+                writer.writerow(('ID', 'Amount', 'Category', 'Date', 'Description'))
+                writer.writerows(
+                    (exp.id, exp.amount, exp.category, exp.date, exp.description)
+                    for exp in expenses
+                )
             print(f"Expenses exported to {filename}")
         except IOError:
             print("Error: Could not export expenses to CSV.")
@@ -277,9 +740,6 @@ class ExpenseManagerGUI:
         self.expense_tree.heading('Description', text='Description')
         self.expense_tree.pack(expand=True, fill='both')
         
-        # Refresh expenses list
-        self._refresh_expense_list()
-        
         # Buttons
         button_frame = ttk.Frame(self.expenses_frame)
         button_frame.pack(fill='x')
@@ -292,6 +752,14 @@ class ExpenseManagerGUI:
         
         delete_btn = ttk.Button(button_frame, text="Delete Expense", command=self._delete_expense)
         delete_btn.pack(side='left', expand=True, fill='x')
+        
+        self.older_btn = ttk.Button(button_frame, text="Show Older Years", command=self._show_older_years)
+        self.older_btn.pack(side='left', expand=True, fill='x')
+        
+        # Populate expenses list from the recent years read at startup,
+        # remembering the tree row of each expense
+        self._tree_iids = {}
+        self._populate_expense_list(self.expense_manager.get_loaded_expenses())
 
     def _create_reports_tab(self):
         """
@@ -352,23 +820,72 @@ class ExpenseManagerGUI:
             
             self.limit_entries[limit_type.lower()] = entry
 
-    def _refresh_expense_list(self):
+    def _populate_expense_list(self, expenses):
         """
-        Refresh the expense list in the treeview
+        Fill the treeview with the given expenses, replacing any rows shown
         """
-        # Clear existing items
-        for i in self.expense_tree.get_children():
-            self.expense_tree.delete(i)
+        if self._tree_iids:
+            self.expense_tree.delete(*self._tree_iids.values())
+            self._tree_iids.clear()
+        
+        # Hiding the columns while inserting avoids a redraw per row
+        self.expense_tree.configure(displaycolumns=())
+        try:
+            for expense in expenses:
+                self._tree_add(expense)
+        finally:
+            self.expense_tree.configure(displaycolumns='#all')
         
-        # Populate with current expenses
-        for expense in self.expense_manager.expenses:
-            self.expense_tree.insert('', 'end', values=(
-                expense['id'], 
-                expense['amount'], 
-                expense['category'], 
-                expense['date'], 
-                expense.get('description', '')
-            ))
+        # Nothing more to show once every year has been read
+        state = 'normal' if self.expense_manager.has_unloaded_years() else 'disabled'
+        self.older_btn.configure(state=state)
+
+    def _show_older_years(self):
+        """
+        Read the years left on disk at startup and list their expenses too
+        """
+        self._populate_expense_list(self.expense_manager.get_all_expenses())
+
+    def _sync_expense_list(self):
+        """
+        Refill the treeview if an action read years that were still on disk
+        """
+        if len(self._tree_iids) != len(self.expense_manager.expenses_by_id):
+            self._populate_expense_list(self.expense_manager.get_loaded_expenses())
+
+    @staticmethod
+    def _tree_values(expense):
+        """
+        Column values shown in the treeview for an expense
+        """
+        return (
+            expense.id, 
+            expense.amount, 
+            expense.category, 
+            expense.date, 
+            expense.description
+        )
+
+    def _tree_add(self, expense):
+        """
+        Append a row for a new expense
+        """
+        iid = self.expense_tree.insert('', 'end', values=self._tree_values(expense))
+        self._tree_iids[expense.id] = iid
+
+    def _tree_update(self, expense):
+        """
+        Refresh the row of an edited expense
+        """
+        self.expense_tree.item(self._tree_iids[expense.id], values=self._tree_values(expense))
+
+    def _tree_remove(self, expense_id):
+        """
+        Remove the row of a deleted expense
+        """
+        iid = self._tree_iids.pop(expense_id, None)
+        if iid is not None:
+            self.expense_tree.delete(iid)
 
     def _add_expense_dialog(self):
         """
@@ -406,13 +923,14 @@ class ExpenseManagerGUI:
                 date = date_entry.get() or None
                 description = desc_entry.get()
                 
-                self.expense_manager.add_expense(
+                expense = self.expense_manager.add_expense(
                     amount, 
                     category, 
                     date, 
                     description
                 )
-                self._refresh_expense_list()
+                self._tree_add(expense)
+                self._sync_expense_list()
                 dialog.destroy()
             except ValueError as e:
                 messagebox.showerror("Error", str(e))
@@ -439,11 +957,7 @@ class ExpenseManagerGUI:
         dialog.geometry("400x300")
         
         # Find the selected expense
-        selected_expense = None
-        for expense in self.expense_manager.expenses:
-            if expense['id'] == expense_id:
-                selected_expense = expense
-                break
+        selected_expense = self.expense_manager.get_expense(expense_id)
         
         if not selected_expense:
             messagebox.showerror("Error", "Expense not found")
@@ -453,25 +967,25 @@ class ExpenseManagerGUI:
         # Amount
         ttk.Label(dialog, text="Amount:").pack()
         amount_entry = ttk.Entry(dialog)
-        amount_entry.insert(0, str(selected_expense['amount']))
+        amount_entry.insert(0, str(selected_expense.amount))
         amount_entry.pack()
         
         # Category
         ttk.Label(dialog, text="Category:").pack()
         category_entry = ttk.Entry(dialog)
-        category_entry.insert(0, selected_expense['category'])
+        category_entry.insert(0, selected_expense.category)
         category_entry.pack()
         
         # Date
         ttk.Label(dialog, text="Date (YYYY-MM-DD):").pack()
         date_entry = ttk.Entry(dialog)
-        date_entry.insert(0, selected_expense['date'])
+        date_entry.insert(0, selected_expense.date)
         date_entry.pack()
         
         # Description
         ttk.Label(dialog, text="Description:").pack()
         desc_entry = ttk.Entry(dialog)
-        desc_entry.insert(0, selected_expense.get('description', ''))
+        desc_entry.insert(0, selected_expense.description)
         desc_entry.pack()
         
         def submit():
@@ -481,28 +995,29 @@ class ExpenseManagerGUI:
                 
                 # Check and add amount if changed
                 new_amount = float(amount_entry.get())
-                if new_amount != selected_expense['amount']:
+                if new_amount != selected_expense.amount:
                     update_data['amount'] = new_amount
                 
                 # Check and add category if changed
                 new_category = category_entry.get()
-                if new_category != selected_expense['category']:
+                if new_category != selected_expense.category:
                     update_data['category'] = new_category
                 
                 # Check and add date if changed
                 new_date = date_entry.get()
-                if new_date != selected_expense['date']:
+                if new_date != selected_expense.date:
                     update_data['date'] = new_date
                 
                 # Check and add description if changed
                 new_desc = desc_entry.get()
-                if new_desc != selected_expense.get('description', ''):
+                if new_desc != selected_expense.description:
                     update_data['description'] = new_desc
                 
                 # Update expense if there are changes
                 if update_data:
-                    self.expense_manager.edit_expense(expense_id, **update_data)
-                    self._refresh_expense_list()
+                    expense = self.expense_manager.edit_expense(expense_id, **update_data)
+                    self._tree_update(expense)
+                    self._sync_expense_list()
                 
                 dialog.destroy()
             except ValueError as e:
@@ -530,8 +1045,9 @@ class ExpenseManagerGUI:
             # Delete expense
             self.expense_manager.delete_expense(expense_id)
             
-            # Refresh the list
-            self._refresh_expense_list()
+            # Remove it from the list
+            self._tree_remove(expense_id)
+            self._sync_expense_list()
 
     def _set_income(self):
         """
@@ -570,38 +1086,46 @@ class ExpenseManagerGUI:
         # Generate report
         report = self.expense_manager.generate_expense_report()
         
-        # Format report text
-        report_str = "Expense Report\n"
-        report_str += "=" * 50 + "\n\n"
-        
-        report_str += f"Total Income: ${report['income']:.2f}\n"
-        report_str += f"Total Expenses: ${report['total_expenses']:.2f}\n"
-        report_str += f"Remaining Budget: ${report['remaining_budget']:.2f}\n\n"
-        
-        report_str += "Expenses by Category:\n"
-        for category, amount in report['category_breakdown'].items():
-            report_str += f"  {category}: ${amount:.2f}\n"
+        # Format report text as a list of parts joined once
+        parts = [
+            "Expense Report\n",
+            "=" * 50 + "\n\n",
+            f"Total Income: ${report['income']:.2f}\n",
+            f"Total Expenses: ${report['total_expenses']:.2f}\n",
+            f"Remaining Budget: ${report['remaining_budget']:.2f}\n\n",
+            "Expenses by Category:\n"
+        ]
+        parts.extend(
+            f"  {category}: ${amount:.2f}\n"
+            for category, amount in report['category_breakdown'].items()
+        )
         
-        report_str += "\nSpending Limits:\n"
-        for period, limit in report['spending_limits'].items():
-            current_expense = report['current_expenses'][period]
-            report_str += f"  {period.capitalize()} Limit: ${limit:.2f} | "
-            report_str += f"Current {period.capitalize()} Expenses: ${current_expense:.2f}\n"
+        parts.append("\nSpending Limits:\n")
+        current_expenses = report['current_expenses']
+        parts.extend(
+            f"  {period.capitalize()} Limit: ${limit:.2f} | "
+            f"Current {period.capitalize()} Expenses: ${current_expenses[period]:.2f}\n"
+            for period, limit in report['spending_limits'].items()
+        )
         
-        # Display report
-        self.report_text.insert(tk.END, report_str)
+        # Display report with a single insert
+        self.report_text.insert(tk.END, ''.join(parts))
 
     def _export_to_csv(self):
         """
         Export expenses to CSV with file dialog
         """
+        from tkinter import filedialog
+        
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
         
         if filename:
+            # Exporting reads every year, so list the older ones as well
             self.expense_manager.export_to_csv(filename)
+            self._sync_expense_list()
             messagebox.showinfo("Export Successful", f"Expenses exported to {filename}")
 
 def cli_interface():
@@ -713,6 +1237,8 @@ def cli_interface():
             print(f"Error: {e}")
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
+    
+    manager.close()
 
 def main():
     """
@@ -732,8 +1258,9 @@ def main():
             cli_interface()
         elif choice == '2':
             root = tk.Tk()
-            ExpenseManagerGUI(root)
+            gui = ExpenseManagerGUI(root)
             root.mainloop()
+            gui.expense_manager.close()
         elif choice == '3':
             print("Thank you for using Expense Manager!")
             break